@@ -7,9 +7,12 @@ levels and collects performance metrics.
 
 import argparse
 import datetime
+import logging
 import os
-import statistics
 import time
+from pathlib import Path
+
+import numpy as np
 
 # Import modules
 from load_test_modules.config import (
@@ -21,6 +24,28 @@ from load_test_modules.test_runner import perform_warmup, run_load_test
 from load_test_modules.data_utils import save_results_to_csv, analyze_results
 from load_test_modules.visualization import create_visualizations, create_scaling_visualization
 
+logger = logging.getLogger(__name__)
+
+# Metrics tracked for each (concurrency level, repetition) batch, in the
+# column order of the per_batch_metrics array below
+BATCH_METRICS = (
+    "response_time",
+    "throughput",
+    "success_rate",
+    "system_output_token_throughput",
+    "system_combined_token_throughput",
+)
+
+def print_summary_table(summary, test_type):
+    """Print the per-concurrency summary table"""
+    print(f"\n===== {test_type.upper()} TEST SUMMARY (AVERAGED ACROSS REPETITIONS) =====")
+    print("Concurrency | Success Rate | Mean Response Time (s) | Throughput (req/s)")
+    print("-----------|----------|-------------|----------------------|------------------")
+    for data in summary:
+        print(f"{data['concurrency']:11d} | {data['mean_success_rate']*100:11.2f}% | "
+              f"{data['mean_response_time']:20.2f} ± {data['stdev_response_time']:5.2f} | "
+              f"{data['mean_throughput']:8.2f} ± {data['stdev_throughput']:5.2f}")
+
 def run_test(args):
     """Run load testing with specified parameters"""
     all_results = []
@@ -43,113 +68,86 @@ def run_test(args):
         output_basename = f"scaling_test_{timestamp}"
     else:
         output_basename = f"load_test_{timestamp}_c{concurrency_levels[0]}"
+
+    # Create the results directory here rather than at config import time
+    results_dir = Path(RESULTS_DIR)
+    results_dir.mkdir(parents=True, exist_ok=True)
     
     print(f"Testing with concurrency levels: {concurrency_levels}")
     
-    # Store metrics for all concurrency levels
-    summary = []
-    concurrency_metrics = {}
-    
-    for concurrency in concurrency_levels:
+    # Per-batch metrics in a (levels, repetitions, metrics) array so the
+    # summary reduces to two vectorized passes after the loop
+    per_batch_metrics = np.zeros((len(concurrency_levels), args.repetitions, len(BATCH_METRICS)))
+
+    for level_index, concurrency in enumerate(concurrency_levels):
         print(f"\n===== Testing concurrency level: {concurrency} =====")
-        
-        concurrency_metrics[concurrency] = {
-            "response_times": [],
-            "throughputs": [],
-            "success_rates": [],
-            "system_output_token_throughputs": [],
-            "system_combined_token_throughputs": [],
-        }
-        
-        # Always set number of requests equal to concurrency
-        num_requests = concurrency
-        
+
+        # Number of requests per batch defaults to the concurrency level; a
+        # larger --num-requests is rate-limited by the semaphore in the runner
+        num_requests = args.num_requests if args.num_requests else concurrency
+
         # For each concurrency level, run multiple repetitions
         for repetition in range(1, args.repetitions + 1):
             print(f"\nRunning batch {repetition}/{args.repetitions} with {concurrency} concurrent requests")
-            
+
             # Run the load test with the specified concurrency
             results = run_load_test(concurrency, num_requests, prompts, repetition)
-            
-            # Debug the raw response times
-            print(f"DEBUG - Raw response times: {[r.get('response_time', 0) for r in results if r.get('success', False)]}")
-            
+
             metrics = analyze_results(results)
-            print(f"DEBUG - Mean response time from metrics: {metrics.get('mean_response_time', 'N/A')}")
-            
+            logger.debug("Mean response time from metrics: %s", metrics.get('mean_response_time', 'N/A'))
+
             all_results.extend(results)
-            
+
             # Store metrics for each repetition
-            for metric_key in concurrency_metrics[concurrency]:
-                metric_name = metric_key.rstrip('s')  # Convert plural to singular
-                
-                if metric_name == "response_time":
-                    value = metrics.get('mean_response_time', 0)
-                else:
-                    value = metrics.get(metric_name, 0)
-                    
-                print(f"DEBUG - Adding {metric_name}: {value}")
-                concurrency_metrics[concurrency][metric_key].append(value)
-        
-        # Calculate statistics for this concurrency level
-        summary_entry = {"concurrency": concurrency, "requests": num_requests}
-        
-        # Calculate mean and standard deviation for all metrics
-        for metric_key, values in concurrency_metrics[concurrency].items():
-            metric_name = metric_key.rstrip('s')  # Convert plural to singular
-            print(f"DEBUG - Calculating mean for {metric_name} from values: {values}")
-            
-            # Make sure we only average non-zero values for response_time
-            if metric_key == "response_times":
-                non_zero_values = [v for v in values if v > 0]
-                if non_zero_values:
-                    summary_entry[f"mean_{metric_name}"] = statistics.mean(non_zero_values)
-                    if len(non_zero_values) > 1:
-                        summary_entry[f"stdev_{metric_name}"] = statistics.stdev(non_zero_values)
-                    else:
-                        summary_entry[f"stdev_{metric_name}"] = 0
-                else:
-                    summary_entry[f"mean_{metric_name}"] = 0
-                    summary_entry[f"stdev_{metric_name}"] = 0
-            else:
-                # For other metrics
-                if values:
-                    summary_entry[f"mean_{metric_name}"] = statistics.mean(values)
-                    if len(values) > 1:
-                        summary_entry[f"stdev_{metric_name}"] = statistics.stdev(values)
-                    else:
-                        summary_entry[f"stdev_{metric_name}"] = 0
-                else:
-                    summary_entry[f"mean_{metric_name}"] = 0
-                    summary_entry[f"stdev_{metric_name}"] = 0
-        
-        summary.append(summary_entry)
-        
+            per_batch_metrics[level_index, repetition - 1] = [
+                metrics.get('mean_response_time', 0),
+                metrics.get('throughput', 0),
+                metrics.get('success_rate', 0),
+                metrics.get('system_output_token_throughput', 0),
+                metrics.get('system_combined_token_throughput', 0),
+            ]
+
         # Break between concurrency levels if not the last one
-        if concurrency_levels.index(concurrency) < len(concurrency_levels) - 1:
+        if level_index < len(concurrency_levels) - 1:
             print(f"Taking a {args.break_time} second break between concurrency levels...")
             time.sleep(args.break_time)
-    
-    # Print summary table
-    print(f"\n===== {test_type.upper()} TEST SUMMARY (AVERAGED ACROSS REPETITIONS) =====")
-    print("Concurrency | Success Rate | Mean Response Time (s) | Throughput (req/s)")
-    print("-----------|----------|-------------|----------------------|------------------")
-    for data in summary:
-        print(f"{data['concurrency']:11d} | {data['mean_success_rate']*100:11.2f}% | "
-              f"{data['mean_response_time']:20.2f} ± {data['stdev_response_time']:5.2f} | "
-              f"{data['mean_throughput']:8.2f} ± {data['stdev_throughput']:5.2f}")
-    
+
+    # Reduce across repetitions in one pass per statistic. Response times of
+    # zero mean a batch with no successful requests, so mask them out of the
+    # response-time column like the old per-level filtering did.
+    masked = np.ma.masked_array(per_batch_metrics, mask=False)
+    masked[:, :, 0] = np.ma.masked_equal(per_batch_metrics[:, :, 0], 0.0)
+    means = masked.mean(axis=1).filled(0)
+    if args.repetitions > 1:
+        stds = masked.std(axis=1, ddof=1).filled(0)
+    else:
+        stds = np.zeros_like(means)
+
+    summary = []
+    for level_index, concurrency in enumerate(concurrency_levels):
+        summary_entry = {
+            "concurrency": concurrency,
+            "requests": args.num_requests if args.num_requests else concurrency,
+        }
+        for metric_index, metric_name in enumerate(BATCH_METRICS):
+            summary_entry[f"mean_{metric_name}"] = float(means[level_index, metric_index])
+            summary_entry[f"stdev_{metric_name}"] = float(stds[level_index, metric_index])
+        summary.append(summary_entry)
+
+    print_summary_table(summary, test_type)
+
     # Save all results to CSV
-    csv_file = os.path.join(RESULTS_DIR, f"{output_basename}.csv")
-    viz_prefix = os.path.join(RESULTS_DIR, output_basename)
-    save_results_to_csv(all_results, csv_file)
-    
-    # Create visualizations (common for both test types)
-    viz_files = create_visualizations(csv_file, viz_prefix)
+    csv_file = results_dir / f"{output_basename}.csv"
+    viz_prefix = results_dir / output_basename
+    results_df = save_results_to_csv(all_results, csv_file)
+
+    # Create visualizations (common for both test types); pass the DataFrame
+    # so the CSV just written isn't immediately re-parsed
+    viz_files = create_visualizations(csv_file, viz_prefix, df=results_df)
     
     # Add scaling visualization only if multiple concurrency levels
     if is_scaling_test:
-        scaling_viz_file = os.path.join(RESULTS_DIR, f"scaling_performance_{timestamp}.png")
+        scaling_viz_file = results_dir / f"scaling_performance_{timestamp}.png"
         create_scaling_visualization(summary, scaling_viz_file)
         viz_files.append(scaling_viz_file)
     
@@ -171,8 +169,12 @@ def main():
                         help="Number of seconds to wait between test runs")
     parser.add_argument("--concurrency-levels", nargs='+', type=int, 
                         help="Custom concurrency levels to test (overrides config)")
+    parser.add_argument("--num-requests", type=int,
+                        help="Requests per batch (defaults to the concurrency level)")
     args = parser.parse_args()
     
+    logging.basicConfig(level=os.getenv("LOGLEVEL", "INFO"))
+    
     # Perform warm-up requests only once
     if args.warmup > 0:
         perform_warmup(args.warmup)
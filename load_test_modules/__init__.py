@@ -6,7 +6,7 @@ from load_test_modules.config import (
     DEFAULT_WARMUP, DEFAULT_BREAK_TIME, CONCURRENCY_LEVELS
 )
 from load_test_modules.prompt_manager import generate_prompts_with_uuid
-from load_test_modules.api_client import send_request
-from load_test_modules.test_runner import perform_warmup, run_load_test
+from load_test_modules.api_client import send_request, send_request_async
+from load_test_modules.test_runner import perform_warmup, run_load_test, run_load_test_async
 from load_test_modules.data_utils import save_results_to_csv, analyze_results
 from load_test_modules.visualization import create_visualizations, create_scaling_visualization
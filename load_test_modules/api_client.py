@@ -1,74 +1,101 @@
 """API client for sending requests to model endpoints."""
 
+import logging
 import time
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 from load_test_modules.config import API_URL, AUTH_TOKEN, MODEL, DEFAULT_MAX_TOKENS, DEFAULT_TEMPERATURE
+from load_test_modules.prompt_manager import BASE_TOKENS
+
+# Shared session so connections (and TLS handshakes) are reused across requests.
+# The adapter pool is sized generously so high concurrency levels don't stall
+# waiting for a free connection (requests.Session is thread-safe).
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=64, pool_maxsize=128, max_retries=0)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
+# Headers are identical for every request, so build them once
+HEADERS = {
+    "Content-Type": "application/json",
+    "Authorization": f"Bearer {AUTH_TOKEN}"
+}
+
+logger = logging.getLogger(__name__)
+
+# The endpoint type is fixed at import time, so decide the request format once
+_IS_SCORE = "/score" in API_URL
+ENDPOINT_TYPE = "/score" if _IS_SCORE else "/v1/chat/completions"
+
+# Generation parameters never change between requests
+_PARAMETERS = {
+    "temperature": DEFAULT_TEMPERATURE,
+    "max_tokens": DEFAULT_MAX_TOKENS
+}
+
+def _build_score_payload(prompt):
+    """Request body for an Azure ML Managed Online Endpoint (/score)"""
+    return {
+        "input_data": {
+            "input_string": [{"role": "user", "content": prompt}],
+            "parameters": _PARAMETERS
+        }
+    }
+
+def _build_openai_payload(prompt):
+    """Request body for an OpenAI-compatible endpoint (/v1/chat/completions)"""
+    return {
+        "model": MODEL,
+        "messages": [{"role": "user", "content": prompt}],
+        "max_tokens": DEFAULT_MAX_TOKENS,
+        "temperature": DEFAULT_TEMPERATURE
+    }
+
+def _parse_score_response(result):
+    """Extract generated text and token counts from a /score response"""
+    token_count = result.get('token_count', {})
+    return (result.get('output', ''),
+            token_count.get('completion_tokens', 0),
+            token_count.get('prompt_tokens', 0))
+
+def _parse_openai_response(result):
+    """Extract generated text and token counts from a /v1/chat/completions response"""
+    usage = result.get('usage', {})
+    return (result.get('choices', [{}])[0].get('message', {}).get('content', ''),
+            usage.get('completion_tokens', 0),
+            usage.get('prompt_tokens', 0))
+
+# Bind the endpoint-specific implementations once so the hot path carries
+# no per-request format branches
+build_payload = _build_score_payload if _IS_SCORE else _build_openai_payload
+parse_response = _parse_score_response if _IS_SCORE else _parse_openai_response
 
 def send_request(prompt):
     """Send a single request to the API and return metrics"""
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {AUTH_TOKEN}"
-    }
-    
-    # Dynamically determine request format based on the endpoint
-    if "/score" in API_URL:
-        # Format for Azure ML Managed Online Endpoint (/score)
-        data = {
-            "input_data": {
-                "input_string": [
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                "parameters": {
-                    "temperature": DEFAULT_TEMPERATURE,
-                    "max_tokens": DEFAULT_MAX_TOKENS
-                }
-            }
-        }
-    else:
-        # Format for OpenAI-compatible endpoint (/v1/chat/completions)
-        data = {
-            "model": MODEL,
-            "messages": [
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            "max_tokens": DEFAULT_MAX_TOKENS,
-            "temperature": DEFAULT_TEMPERATURE
-        }
-    
-    print(f"DEBUG: Sending request to {API_URL}")
-    start_time = time.time()
+    headers = HEADERS
+    # Serialize once with orjson so requests doesn't run the stdlib encoder
+    body = orjson.dumps(build_payload(prompt))
+
+    logger.debug("Sending request to %s", API_URL)
+    start_time = time.perf_counter()
     try:
-        response = requests.post(API_URL, headers=headers, json=data)
-        elapsed = time.time() - start_time
-        print(f"DEBUG: Request completed in {elapsed:.4f} seconds with status {response.status_code}")
+        response = _SESSION.post(API_URL, headers=headers, data=body, timeout=(5, 120))
+        elapsed = time.perf_counter() - start_time
+        logger.debug("Request completed in %.4f seconds with status %s", elapsed, response.status_code)
         
         if response.status_code == 200:
             try:
-                result = response.json()
+                result = orjson.loads(response.content)
                 
-                # Extract tokens based on endpoint type
-                if "/score" in API_URL:
-                    # Parse response from /score endpoint
-                    generated_text = result.get('output', '')
-                    tokens_generated = result.get('token_count', {}).get('completion_tokens', 0)
-                    tokens_input = result.get('token_count', {}).get('prompt_tokens', 0)
-                else:
-                    # Parse response from /v1/chat/completions endpoint
-                    generated_text = result.get('choices', [{}])[0].get('message', {}).get('content', '')
-                    tokens_generated = result.get('usage', {}).get('completion_tokens', 0)
-                    tokens_input = result.get('usage', {}).get('prompt_tokens', 0)
+                # Extract tokens via the parser bound for this endpoint type
+                generated_text, tokens_generated, tokens_input = parse_response(result)
                 
-                # If token counts weren't provided, estimate them
+                # If token counts weren't provided, estimate them; the prompt is
+                # a UUID word plus the constant base prompt, so skip the split
                 if not tokens_generated:
                     tokens_generated = len(generated_text.split()) if generated_text else 0
-                    tokens_input = len(prompt.split())
+                    tokens_input = 1 + BASE_TOKENS
                 
                 total_tokens = tokens_generated + tokens_input
                 
@@ -82,13 +109,13 @@ def send_request(prompt):
                     "tokens_per_second": tokens_generated / elapsed if elapsed > 0 else 0,
                     "total_tokens_per_second": total_tokens / elapsed if elapsed > 0 else 0,
                     "timestamp": time.time(),
-                    "endpoint_type": "/score" if "/score" in API_URL else "/v1/chat/completions"
+                    "endpoint_type": ENDPOINT_TYPE
                 }
-                print(f"DEBUG: Successful response with response_time={elapsed:.4f}")
+                logger.debug("Successful response with response_time=%.4f", elapsed)
                 return return_data
                 
             except Exception as e:
-                print(f"DEBUG: Parsing error: {str(e)}")
+                logger.debug("Parsing error: %s", e)
                 return {
                     "success": True,
                     "status_code": response.status_code,
@@ -100,25 +127,106 @@ def send_request(prompt):
                     "total_tokens_per_second": None,
                     "timestamp": time.time(),
                     "parsing_error": str(e),
-                    "endpoint_type": "/score" if "/score" in API_URL else "/v1/chat/completions"
+                    "endpoint_type": ENDPOINT_TYPE
                 }
         else:
-            print(f"DEBUG: Failed response with status {response.status_code}")
+            logger.debug("Failed response with status %s", response.status_code)
             return {
                 "success": False,
                 "status_code": response.status_code,
                 "error": response.text,
                 "response_time": elapsed,
                 "timestamp": time.time(),
-                "endpoint_type": "/score" if "/score" in API_URL else "/v1/chat/completions"
+                "endpoint_type": ENDPOINT_TYPE
             }
     except Exception as e:
-        elapsed = time.time() - start_time
-        print(f"DEBUG: Exception during request: {str(e)}")
+        elapsed = time.perf_counter() - start_time
+        logger.debug("Exception during request: %s", e)
+        return {
+            "success": False,
+            "error": str(e),
+            "response_time": elapsed,
+            "timestamp": time.time(),
+            "endpoint_type": ENDPOINT_TYPE
+        }
+
+async def send_request_async(session, prompt):
+    """Send a single request to the API over a shared aiohttp session and return metrics"""
+    headers = HEADERS
+    # Serialize once with orjson so aiohttp doesn't run the stdlib encoder
+    body = orjson.dumps(build_payload(prompt))
+
+    logger.debug("Sending request to %s", API_URL)
+    start_time = time.perf_counter()
+    try:
+        async with session.post(API_URL, headers=headers, data=body) as response:
+            if response.status == 200:
+                try:
+                    result = orjson.loads(await response.read())
+                    elapsed = time.perf_counter() - start_time
+                    logger.debug("Request completed in %.4f seconds with status %s", elapsed, response.status)
+
+                    # Extract tokens via the parser bound for this endpoint type
+                    generated_text, tokens_generated, tokens_input = parse_response(result)
+
+                    # If token counts weren't provided, estimate them; the prompt is
+                    # a UUID word plus the constant base prompt, so skip the split
+                    if not tokens_generated:
+                        tokens_generated = len(generated_text.split()) if generated_text else 0
+                        tokens_input = 1 + BASE_TOKENS
+
+                    total_tokens = tokens_generated + tokens_input
+
+                    return_data = {
+                        "success": True,
+                        "status_code": response.status,
+                        "response_time": elapsed,
+                        "tokens_generated": tokens_generated,
+                        "tokens_input": tokens_input,
+                        "total_tokens": total_tokens,
+                        "tokens_per_second": tokens_generated / elapsed if elapsed > 0 else 0,
+                        "total_tokens_per_second": total_tokens / elapsed if elapsed > 0 else 0,
+                        "timestamp": time.time(),
+                        "endpoint_type": ENDPOINT_TYPE
+                    }
+                    logger.debug("Successful response with response_time=%.4f", elapsed)
+                    return return_data
+
+                except Exception as e:
+                    elapsed = time.perf_counter() - start_time
+                    logger.debug("Parsing error: %s", e)
+                    return {
+                        "success": True,
+                        "status_code": response.status,
+                        "response_time": elapsed,
+                        "tokens_generated": None,
+                        "tokens_input": None,
+                        "total_tokens": None,
+                        "tokens_per_second": None,
+                        "total_tokens_per_second": None,
+                        "timestamp": time.time(),
+                        "parsing_error": str(e),
+                        "endpoint_type": ENDPOINT_TYPE
+                    }
+            else:
+                error_text = await response.text()
+                elapsed = time.perf_counter() - start_time
+                logger.debug("Failed response with status %s", response.status)
+                return {
+                    "success": False,
+                    "status_code": response.status,
+                    "error": error_text,
+                    "response_time": elapsed,
+                    "timestamp": time.time(),
+                    "endpoint_type": ENDPOINT_TYPE
+                }
+    except Exception as e:
+        elapsed = time.perf_counter() - start_time
+        logger.debug("Exception during request: %s", e)
         return {
             "success": False,
             "error": str(e),
             "response_time": elapsed,
             "timestamp": time.time(),
-            "endpoint_type": "/score" if "/score" in API_URL else "/v1/chat/completions"
+            "endpoint_type": ENDPOINT_TYPE
         }
\ No newline at end of file
@@ -1,7 +1,5 @@
 """Configuration settings for load tests."""
 
-import os
-
 # API Configuration
 # API endpoint URL - change this to your LLM API endpoint works for /v1/chat/completions or /score
 API_URL = ""
@@ -10,9 +8,8 @@ AUTH_TOKEN = ""
 # Model identifier (for OpenAI-format-compatible endpoints)
 MODEL = "meta-llama/Llama-3.3-70B-Instruct" # Change this to your model name
 
-# Results directory
+# Results directory (created by run_test when results are written)
 RESULTS_DIR = "load_test_results_llama_70B_500_in_64_MAAP_out" # Change this to your desired results directory
-os.makedirs(RESULTS_DIR, exist_ok=True)
 
 # Number of repetitions for each test to calculate averages and standard deviation
 DEFAULT_REPETITIONS = 3
@@ -1,10 +1,17 @@
 """Manages prompt generation for load tests."""
 
-import uuid
+import os
 from load_test_modules.prompt_template import BASE_PROMPT
 
+# Word count of the shared base prompt, computed once. Every generated prompt
+# is "<uuid> <BASE_PROMPT>", so its estimated token count is BASE_TOKENS + 1.
+BASE_TOKENS = len(BASE_PROMPT.split())
+
 def generate_prompts_with_uuid(count=1000, base_prompt=None):
-    """Generate multiple prompts with unique UUIDs"""
+    """Generate multiple prompts with unique UUID prefixes"""
     if base_prompt is None:
         base_prompt = BASE_PROMPT
-    return [f"{uuid.uuid4()} {base_prompt}" for _ in range(count)]
\ No newline at end of file
+    # One urandom read for the whole batch instead of a syscall per uuid4();
+    # each prompt gets a unique 32-hex-character prefix (still a single word)
+    raw = os.urandom(16 * count).hex()
+    return [f"{raw[i * 32:(i + 1) * 32]} {base_prompt}" for i in range(count)]
\ No newline at end of file
@@ -1,11 +1,13 @@
 """Manages the execution of load tests."""
 
+import asyncio
 import time
 import random
 import concurrent.futures
+import aiohttp
 from tqdm import tqdm
 
-from load_test_modules.api_client import send_request
+from load_test_modules.api_client import send_request, send_request_async
 from load_test_modules.prompt_manager import generate_prompts_with_uuid
 
 def perform_warmup(num_requests=5):
@@ -15,17 +17,20 @@ def perform_warmup(num_requests=5):
     """
     print(f"\nPerforming {num_requests} warm-up requests...")
     warmup_results = []
-    
+
     # Use distinct prompts for warm-up to avoid any caching effects
     warmup_prompts = generate_prompts_with_uuid(num_requests, base_prompt="This is a warm-up request to initialize the GPU.")
-    
-    # Send the warm-up requests serially
-    for i, prompt in enumerate(warmup_prompts):
-        result = send_request(prompt)
-        warmup_results.append(result)
-        status = "✓" if result["success"] else "✗"
-        print(f"  Warm-up request {i+1}/{num_requests}: {status} ({result['response_time']:.2f}s)")
-    
+
+    # Send the warm-up requests concurrently; warm-up still primes the GPU but
+    # only takes about one request's latency instead of num_requests of them
+    with concurrent.futures.ThreadPoolExecutor(max_workers=num_requests) as executor:
+        futures = [executor.submit(send_request, prompt) for prompt in warmup_prompts]
+        for i, future in enumerate(concurrent.futures.as_completed(futures)):
+            result = future.result()
+            warmup_results.append(result)
+            status = "✓" if result["success"] else "✗"
+            print(f"  Warm-up request {i+1}/{num_requests}: {status} ({result['response_time']:.2f}s)")
+
     success_count = sum(1 for r in warmup_results if r["success"])
     print(f"Warm-up complete: {success_count}/{num_requests} successful requests\n")
     
@@ -36,31 +41,59 @@ def perform_warmup(num_requests=5):
 
 def run_load_test(concurrency, num_requests, prompts, repetition=1):
     """Run a load test with the specified concurrency level and number of requests"""
+    return asyncio.run(run_load_test_async(concurrency, num_requests, prompts, repetition))
+
+async def run_load_test_async(concurrency, num_requests, prompts, repetition=1):
+    """Async implementation of the load test using a shared aiohttp session"""
     print(f"\nRunning load test with {concurrency} concurrent requests, {num_requests} total requests (Repetition {repetition}/{3})")
-    
-    results = []
-    start_time = time.time()
-    with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+
+    # Bound the number of in-flight requests to the concurrency level
+    semaphore = asyncio.Semaphore(concurrency)
+
+    # Preallocate one slot per request; each task owns its own index, so
+    # results are written in place without list resizes or locking
+    results = [None] * num_requests
+    start_time = time.perf_counter()
+    # One session per test so connections are reused across requests. Capping
+    # the connector at the concurrency level and caching DNS lookups prevents
+    # connection churn (TIME_WAIT pile-up, repeated lookups) from polluting the
+    # measured response times.
+    connector = aiohttp.TCPConnector(
+        limit=concurrency,
+        limit_per_host=concurrency,
+        keepalive_timeout=75,
+        ttl_dns_cache=300,
+        use_dns_cache=True,
+        force_close=False,
+    )
+    async with aiohttp.ClientSession(connector=connector) as session:
+        async def bounded_request(index, prompt):
+            async with semaphore:
+                results[index] = await send_request_async(session, prompt)
+
+        # Pick the batch of prompts up front: sampling without replacement avoids
+        # accidental server-side prompt-cache hits, and seeding on the repetition
+        # makes the selection reproducible across runs
+        rng = random.Random(repetition)
+        if num_requests <= len(prompts):
+            chosen_prompts = rng.sample(prompts, num_requests)
+        else:
+            chosen_prompts = rng.choices(prompts, k=num_requests)
+
         # Submit all tasks
-        futures = []
-        for _ in range(num_requests):
-            prompt = random.choice(prompts)
-            futures.append(executor.submit(send_request, prompt))
-            
-        # Process results as they complete
-        for future in tqdm(concurrent.futures.as_completed(futures), total=num_requests):
-            results.append(future.result())
-    
-    total_duration = time.time() - start_time
+        tasks = [asyncio.ensure_future(bounded_request(i, prompt))
+                 for i, prompt in enumerate(chosen_prompts)]
+
+        # Track completions for the progress bar; results land in their slots
+        for task in tqdm(asyncio.as_completed(tasks), total=num_requests):
+            await task
+
+    total_duration = time.perf_counter() - start_time
     
     # Add test metadata to each result
     for result in results:
         result["test_duration"] = total_duration
         result["concurrency"] = concurrency
         result["repetition"] = repetition
-        
-        # Debug response times
-        if "response_time" in result:
-            print(f"DEBUG - Response time in result: {result['response_time']}")
-    
+
     return results
\ No newline at end of file